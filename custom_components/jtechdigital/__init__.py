@@ -4,8 +4,8 @@ from __future__ import annotations
 from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform, CONF_HOST, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import JtechCoordinator
@@ -23,9 +23,16 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     username = config_entry.data[CONF_USERNAME]
     password = config_entry.data[CONF_PASSWORD]
 
-    coordinator = JtechCoordinator(hass=hass, host=host, username=username, password=password)
+    coordinator = JtechCoordinator(hass=hass, host=host, username=username, password=password, options=config_entry.options)
 
     config_entry.async_on_unload(config_entry.add_update_listener(update_listener))
+    config_entry.async_on_unload(coordinator.async_close)
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the device session when Home Assistant shuts down, unload does not run then."""
+        await coordinator.async_close()
+
+    config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session))
 
     await coordinator.async_config_entry_first_refresh()
 
@@ -49,7 +56,6 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle options update."""
+    # options are applied in place, connection changes go through reauth which reloads the entry itself
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     coordinator.update_options(config_entry.options)
-
-    await hass.config_entries.async_reload(config_entry.entry_id)
\ No newline at end of file
@@ -1,10 +1,11 @@
 """Config flow to configure the J-Tech Digital HDMI Matrix integration."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
 from typing import Any
 
-from aiohttp import CookieJar
+from aiohttp import ClientSession, CookieJar
 from pyjtechdigital import JtechClient, JtechError, JtechAuthError, JtechNotSupported
 import voluptuous as vol
 
@@ -36,6 +37,7 @@ class JtechConfigFlow(ConfigFlow, domain=DOMAIN):
         self.entry: ConfigEntry | None = None
 
         self._data: dict[str, Any] = {}
+        self._session: ClientSession | None = None
         self._client: JtechClient | None = None
 
 
@@ -93,30 +95,21 @@ class JtechConfigFlow(ConfigFlow, domain=DOMAIN):
                 else :
                     return await self._async_create_entry()
         elif not self.entry:
-            try:
-                self._data[CONF_USERNAME] = "User"
-                self._data[CONF_PASSWORD] = "user"
-                await self._async_client_connect()
-
-                schema = {
-                    vol.Required(CONF_USERNAME, default=self._data[CONF_USERNAME]): str,
-                    vol.Required(CONF_PASSWORD, default=self._data[CONF_PASSWORD]): str,
-                }
-            except:
-                pass
-
-            try:
-                self._data[CONF_USERNAME] = "Admin"
-                self._data[CONF_PASSWORD] = "admin"
-                await self._async_client_connect()
+            # probe the factory credentials concurrently, admin wins when both are accepted
+            default_credentials = (("User", "user"), ("Admin", "admin"))
+            results = await asyncio.gather(
+                *(self._async_probe_credentials(user, password) for user, password in default_credentials)
+            )
+            for (user, password), accepted in zip(default_credentials, results):
+                if accepted:
+                    self._data[CONF_USERNAME] = user
+                    self._data[CONF_PASSWORD] = password
+
+                    schema = {
+                        vol.Required(CONF_USERNAME, default=self._data[CONF_USERNAME]): str,
+                        vol.Required(CONF_PASSWORD, default=self._data[CONF_PASSWORD]): str,
+                    }
 
-                schema = {
-                    vol.Required(CONF_USERNAME, default=self._data[CONF_USERNAME]): str,
-                    vol.Required(CONF_PASSWORD, default=self._data[CONF_PASSWORD]): str,
-                }
-            except:
-                pass
-            
 
         return self.async_show_form(
             step_id="authorize",
@@ -167,10 +160,33 @@ class JtechConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
     def _create_client(self) -> None:
-        """Create J-Tech Digital HDMI Matrix _client from config."""
+        """Create J-Tech Digital HDMI Matrix _client from config, reused across flow steps."""
+        if self._client is not None:
+            return
+
+        host = self._data[CONF_HOST]
+        self._session = async_create_clientsession(self.hass, cookie_jar=CookieJar(unsafe=True, quote_cookie=False))
+        self._client = JtechClient(host=host, session=self._session)
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the client session once the flow is finished or aborted."""
+        if self._session is not None:
+            self.hass.async_create_task(self._session.close())
+            self._session = None
+            self._client = None
+
+    async def _async_probe_credentials(self, user: str, password: str) -> bool:
+        """Check credentials against J-Tech Digital HDMI Matrix device on a throwaway session."""
         host = self._data[CONF_HOST]
-        session = async_create_clientsession(self.hass, cookie_jar=CookieJar(unsafe=True, quote_cookie=False))
-        self._client = JtechClient(host=host, session=session)
+        session = async_create_clientsession(self.hass, auto_cleanup=False, cookie_jar=CookieJar(unsafe=True, quote_cookie=False))
+        try:
+            await JtechClient(host=host, session=session).connect(user, password)
+        except Exception:
+            return False
+        finally:
+            await session.close()
+        return True
 
     async def _async_client_connect(self) -> None:
         """Connect to J-Tech Digital HDMI Matrix device from config."""
@@ -210,7 +226,6 @@ class JtechOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:   
-            self.hass.async_create_task(self.hass.config_entries.async_reload(self._config_entry.entry_id))
             return self.async_create_entry(data=user_input)
 
         return self.async_show_form(
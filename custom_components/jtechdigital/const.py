@@ -14,6 +14,21 @@ CONF_CEC_DELAY_POWER = "cec_delay_power"
 CONF_CEC_DELAY_SOURCE = "cec_delay_source"
 CONF_CEC_VOLUME_CONTROL = "cec_volume_control"
 
+# mirrored from homeassistant.components.homekit.const so the homekit integration is not imported with this one
+EVENT_HOMEKIT_TV_REMOTE_KEY_PRESSED: Final = "homekit_tv_remote_key_pressed"
+ATTR_KEY_NAME: Final = "key_name"
+KEY_ARROW_DOWN: Final = "arrow_down"
+KEY_ARROW_LEFT: Final = "arrow_left"
+KEY_ARROW_RIGHT: Final = "arrow_right"
+KEY_ARROW_UP: Final = "arrow_up"
+KEY_BACK: Final = "back"
+KEY_FAST_FORWARD: Final = "fast_forward"
+KEY_INFORMATION: Final = "information"
+KEY_REWIND: Final = "rewind"
+KEY_SELECT: Final = "select"
+
+SIGNAL_REMOTE_KEY_PRESSED: Final = f"{DOMAIN}_remote_key_pressed"
+
 ERROR_CONNECT_FAILED = "Failed to connect"
 ERROR_FETCH_DATA_FAILED = "Failed to fetch data"
 ERROR_AUTH_FAILED = "Authentication failed"
@@ -1,40 +1,93 @@
 import asyncio
 import logging
+import time
+from dataclasses import replace
 from datetime import timedelta
-from typing import Any
-from aiohttp import CookieJar
+from aiohttp import ClientSession, CookieJar, TCPConnector
 from pyjtechdigital import JtechClient, JtechAuthError, JtechConnectionError
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN, ATTR_MANUFACTURER, ERROR_CONNECT_FAILED, ERROR_FETCH_DATA_FAILED, ERROR_AUTH_FAILED, ERROR_UNKNOWN
 
-from .structures import JtechOutputInfo, JtechSourceInfo
+from .structures import JtechCoordinatorSnapshot, JtechOutputInfo, JtechSourceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_INTERVAL = timedelta(seconds=10)
+SLOW_UPDATE_INTERVAL = timedelta(minutes=5)
+SLOW_RETRY_INTERVAL = timedelta(minutes=1)
+IDLE_UPDATE_INTERVAL = timedelta(seconds=60)
+IDLE_POLLS_THRESHOLD = 3
+# outlive the idle poll interval, so even an idle matrix reuses its connection
+SESSION_KEEPALIVE_TIMEOUT = IDLE_UPDATE_INTERVAL.total_seconds() * 2
+REQUEST_TIMEOUT = 4
+
+FAST_STATUS_KEYS = ("source", "output", "cec")
+SLOW_STATUS_KEYS = ("network", "system", "web_details")
+
 class JtechCoordinator(DataUpdateCoordinator):
     """Class to manage fetching and storing J-Tech Digital HDMI Matrix data."""
 
-    def __init__(self, hass, host, username, password):
+    def __init__(self, hass, host, username, password, options):
         """Initialize the data coordinator."""
         self.hass = hass
         self.host = host
         self.username = username
         self.password = password
+        self.options = options
+        self._session = None
         self._client = None
+        self._inflight_refresh: asyncio.Task | None = None
+        self._inflight_generation = 0
+        self._command_generation = 0
+        self._slow_statuses = {}
+        self._slow_status_refresh_at = {}
+        self._idle_polls = 0
         self.connected = False
 
         self.outputs = []
         self.sources = []
-
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=timedelta(seconds=10))
+        self.source_list = ()
+        self.source_indexes = {}
+        self.device_info = DeviceInfo(manufacturer=ATTR_MANUFACTURER)
+        self._device_info_key = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+
+    def update_options(self, options):
+        """Apply updated config entry options and notify the entities."""
+        self.options = options
+        self.async_update_listeners()
 
     async def _async_update_data(self):
+        """Fetch the latest data, sharing a fetch that is already in flight."""
+        # a fetch started before the last command completed may return the state from before the write, so only share newer ones
+        if (
+            self._inflight_refresh is None
+            or self._inflight_refresh.done()
+            or self._inflight_generation != self._command_generation
+        ):
+            self._inflight_generation = self._command_generation
+            self._inflight_refresh = self.hass.async_create_background_task(
+                self._async_fetch_data(), name=f"{DOMAIN}_{self.host}_refresh"
+            )
+
+        # a cancelled caller must not cancel the fetch for everyone else sharing it
+        return await asyncio.shield(self._inflight_refresh)
+
+    async def _async_fetch_data(self):
         """Fetch the latest data from the J-Tech Digital HDMI Matrix."""
         # Implementing the update logic from both versions here
+        generation = self._command_generation
         await self._client_ensure()
 
         try:
@@ -42,52 +95,109 @@ class JtechCoordinator(DataUpdateCoordinator):
 
             statuses = await self._fetch_status()
 
-            _LOGGER.debug("fetch_statuses", statuses)
+            _LOGGER.debug("fetch_statuses %s", statuses)
 
             #edid_status = statuses["edid"]
 
+            if generation != self._command_generation and self.data is not None:
+                # a command completed during this fetch, its answers may predate the write, leave the state to the newer fetch
+                return self.data
+
             self.outputs = self._handle_output_update(statuses)
             self.sources = self._handle_source_update(statuses)
+            self._update_source_list()
 
             # Return the combined_data with only the required information
 
-            combined_data = { }
+            combined_data = JtechCoordinatorSnapshot()
 
             status = statuses["status"]
             if status:
-                combined_data["power"] = status.power
-                combined_data["model"] = status.model
-                combined_data["version"] = status.version
+                combined_data.power = status.power
+                combined_data.model = status.model
+                combined_data.version = status.version
 
             network_status = statuses["network"]
             if network_status:
-                combined_data["hostname"] = network_status.hostname
-                combined_data["ipaddress"] = network_status.ipaddress
-                combined_data["subnet"] = network_status.subnet
-                combined_data["gateway"] = network_status.gateway
-                combined_data["macaddress"] = network_status.macaddress
-                combined_data["dhcp"] = network_status.dhcp
-                combined_data["telnetport"] = network_status.telnetport
-                combined_data["tcpport"] = network_status.tcpport
+                combined_data.hostname = network_status.hostname
+                combined_data.ipaddress = network_status.ipaddress
+                combined_data.subnet = network_status.subnet
+                combined_data.gateway = network_status.gateway
+                combined_data.macaddress = network_status.macaddress
+                combined_data.dhcp = network_status.dhcp
+                combined_data.telnetport = network_status.telnetport
+                combined_data.tcpport = network_status.tcpport
 
             system_status = statuses["system"]
             if system_status:
-                combined_data["baudrate_index"] = system_status.baudrate_index
-                combined_data["beep"] = system_status.beep
-                combined_data["lock"] = system_status.lock
-                combined_data["mode"] = system_status.mode
+                combined_data.baudrate_index = system_status.baudrate_index
+                combined_data.beep = system_status.beep
+                combined_data.lock = system_status.lock
+                combined_data.mode = system_status.mode
 
             web_details = statuses["web_details"]
             if web_details:
-                combined_data["title"] = web_details.title
+                combined_data.title = web_details.title
+
+            self._update_device_info(combined_data)
+            self._update_poll_rate(combined_data)
 
             return combined_data
+        except (ConfigEntryAuthFailed, UpdateFailed):
+            # raised by the re-login, keep them so a changed password still starts reauth
+            raise
         except JtechAuthError as err:
             self.connected = False
-            raise UpdateFailed(ERROR_AUTH_FAILED, err)
+            raise UpdateFailed(ERROR_AUTH_FAILED, err) from err
+        except asyncio.TimeoutError as err:
+            self.connected = False
+            raise UpdateFailed(ERROR_CONNECT_FAILED, err) from err
         except Exception as err:
             self.connected = False
-            raise UpdateFailed(ERROR_FETCH_DATA_FAILED, err)
+            raise UpdateFailed(ERROR_FETCH_DATA_FAILED, err) from err
+
+    def _update_source_list(self):
+        """Rebuild the source names shared by the media players when they change."""
+        source_list = tuple(source.name for source in self.sources or ())
+        if source_list == self.source_list:
+            return
+
+        self.source_list = source_list
+        self.source_indexes = {}
+        for idx, name in enumerate(source_list):
+            self.source_indexes.setdefault(name, idx)
+
+    def _update_poll_rate(self, data):
+        """Poll less often once the matrix has been idle for a few updates."""
+        if data.power is False:
+            idle = True
+        elif self.outputs:
+            idle = not any(output.connected or output.cat_connected for output in self.outputs)
+        else:
+            # the output status request failed, a missing answer says nothing about the matrix being idle
+            return
+        self._idle_polls = self._idle_polls + 1 if idle else 0
+        self.update_interval = IDLE_UPDATE_INTERVAL if self._idle_polls >= IDLE_POLLS_THRESHOLD else UPDATE_INTERVAL
+
+    def _bump_rate(self):
+        """Return to the regular poll interval after a user action."""
+        self._idle_polls = 0
+        self.update_interval = UPDATE_INTERVAL
+
+    def _update_device_info(self, data):
+        """Rebuild the device info shared by all entities when the matrix details change."""
+        key = (data.model, data.version, data.hostname)
+        if key == self._device_info_key:
+            return
+
+        self._device_info_key = key
+        model, version, hostname = key
+        self.device_info = DeviceInfo(
+            manufacturer=ATTR_MANUFACTURER,
+            model=model,
+            sw_version=version,
+            configuration_url=f"http://{hostname}" if hostname else None,
+        )
 
     def _handle_source_update(self, statuses):
         output_status = statuses["output"]
@@ -95,15 +205,20 @@ class JtechCoordinator(DataUpdateCoordinator):
         cec_status = statuses["cec"]
             # Split the source data
         if source_status and source_status.source_names:
+            cec_sources = frozenset(cec_status.selected_cec_sources) if cec_status else frozenset()
+
+            # index the outputs by their selected source once instead of rescanning them per source
+            outputs_by_source = {}
+            if output_status:
+                for output_idx, source in enumerate(output_status.selected_sources):
+                    outputs_by_source.setdefault(source, []).append(output_idx + 1)
+
             sources_data = []
             for idx, source_name in enumerate(source_status.source_names):
                 active = source_status.active_sources[idx]
                 edid_index = source_status.edid_indexes[idx]
-                cec_selected = idx in cec_status.selected_cec_sources
-                outputs = []
-                for output_idx, source in enumerate(output_status.selected_sources):
-                    if source == idx:
-                        outputs.append(output_idx + 1)
+                cec_selected = idx in cec_sources
+                outputs = tuple(outputs_by_source.get(idx, ()))
                 sources_data.append(JtechSourceInfo(outputs, source_name, active, edid_index, cec_selected))
             return sources_data
 
@@ -112,16 +227,26 @@ class JtechCoordinator(DataUpdateCoordinator):
         cec_status = statuses["cec"]
             # Split the output data
         if output_status and output_status.output_names:
+            cec_outputs = frozenset(cec_status.selected_cec_outputs) if cec_status else frozenset()
+
+            selected_sources = output_status.selected_sources
+            cat_names = output_status.output_cat_names
+            connected_outputs = output_status.connected_outputs
+            connected_cat_outputs = output_status.connected_cat_outputs
+            enabled_outputs = output_status.enabled_outputs
+            enabled_cat_outputs = output_status.enabled_cat_outputs
+            output_scalers = output_status.selected_output_scalers
+
             outputs_data = []
             for idx, output_name in enumerate(output_status.output_names):
-                source_idx = output_status.selected_sources[idx]
-                cat_name = output_status.output_cat_names[idx]
-                connected = output_status.connected_outputs[idx]
-                cat_connected = output_status.connected_cat_outputs[idx]
-                enabled = output_status.enabled_outputs[idx]
-                cat_enabled = output_status.enabled_cat_outputs[idx]
-                scaler = output_status.selected_output_scalers[idx]
-                cec_selected = idx in cec_status.selected_cec_outputs
+                source_idx = selected_sources[idx]
+                cat_name = cat_names[idx]
+                connected = connected_outputs[idx]
+                cat_connected = connected_cat_outputs[idx]
+                enabled = enabled_outputs[idx]
+                cat_enabled = enabled_cat_outputs[idx]
+                scaler = output_scalers[idx]
+                cec_selected = idx in cec_outputs
                 outputs_data.append(JtechOutputInfo(source_idx, output_name, cat_name, connected, cat_connected, enabled, cat_enabled, scaler, cec_selected))
             return outputs_data
 
@@ -142,67 +267,142 @@ class JtechCoordinator(DataUpdateCoordinator):
 
     async def _client_ensure(self):
         if not self._client:
-            session = async_create_clientsession(self.hass, cookie_jar=CookieJar(unsafe=True, quote_cookie=False))
-            self._client = JtechClient(self.host, session)
+            # the device keeps its login in a cookie, so use a private session with a keep-alive that outlives the poll interval
+            self._session = ClientSession(
+                connector=TCPConnector(keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT, limit_per_host=8),
+                cookie_jar=CookieJar(unsafe=True, quote_cookie=False),
+            )
+            self._client = JtechClient(self.host, self._session)
 
         await self._client_connect()
 
+    async def async_close(self):
+        """Close the HTTP session shared by every reconnect of the client."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+        self._client = None
+        self.connected = False
+
     async def _fetch_status(self):
+        # network, system and web details hardly ever change, only refresh each of them every SLOW_UPDATE_INTERVAL
+        now = time.monotonic()
+        slow_keys = [key for key in SLOW_STATUS_KEYS if now >= self._slow_status_refresh_at.get(key, 0.0)]
+        client = self._client
+        slow_requests = {
+            "network": client.get_network,
+            "system": client.get_system_status,
+            "web_details": client.get_web_details,
+        }
+
+        # the main status goes first to validate the session, so an expired login does not fail every other request
+        try:
+            status = await asyncio.wait_for(client.get_status(), REQUEST_TIMEOUT)
+        except JtechAuthError:
+            self.connected = False
+            await self._client_connect()
+            try:
+                status = await asyncio.wait_for(client.get_status(), REQUEST_TIMEOUT)
+            except (JtechAuthError, JtechConnectionError, asyncio.TimeoutError):
+                raise
+            except Exception:
+                status = None
+        except (JtechConnectionError, asyncio.TimeoutError):
+            # a matrix that stops answering the session check is offline, not just missing a status
+            raise
+        except Exception:
+            status = None
+
+        # every request gets its own timeout, so a single slow endpoint cannot stall the whole poll
         tasks = [
-            self._client.get_status(),
-            self._client.get_source_status(),
-            self._client.get_output_status(),
-            self._client.get_cec_status(),
-            self._client.get_network(),
-            self._client.get_system_status(),
-            self._client.get_web_details(),
+            asyncio.wait_for(client.get_source_status(), REQUEST_TIMEOUT),
+            asyncio.wait_for(client.get_output_status(), REQUEST_TIMEOUT),
+            asyncio.wait_for(client.get_cec_status(), REQUEST_TIMEOUT),
         ]
+        tasks += [asyncio.wait_for(slow_requests[key](), REQUEST_TIMEOUT) for key in slow_keys]
 
         responses = await asyncio.gather(*tasks, return_exceptions=True)  # continue even if there is an exception
 
-        return dict(zip(
-            [
-                "status",
-                "source",
-                "output",
-                "cec",
-                "network",
-                "system",
-                "web_details",
-            ],
-            [response if not isinstance(response, Exception) else None for response in responses] # filter out exceptions
-        ))
+        # a lost connection or session fails every request, surface it so the device is marked offline
+        for response in responses:
+            if isinstance(response, (JtechAuthError, JtechConnectionError)):
+                raise response
+
+        # a single slow endpoint is tolerated, but a matrix that answers none of them is offline
+        if all(isinstance(response, asyncio.TimeoutError) for response in responses):
+            raise responses[0]
+
+        responses = [response if not isinstance(response, Exception) else None for response in responses] # filter out exceptions
+
+        statuses = {"status": status}
+        statuses.update(zip(FAST_STATUS_KEYS, responses))
+
+        # keep the last good response of a failed request, and retry it sooner than the regular slow refresh
+        for key, value in zip(slow_keys, responses[len(FAST_STATUS_KEYS):]):
+            if value:
+                self._slow_statuses[key] = value
+                self._slow_status_refresh_at[key] = now + SLOW_UPDATE_INTERVAL.total_seconds()
+            else:
+                self._slow_status_refresh_at[key] = now + SLOW_RETRY_INTERVAL.total_seconds()
+
+        for key in SLOW_STATUS_KEYS:
+            statuses[key] = self._slow_statuses.get(key)
+
+        return statuses
+
+    @callback
+    def async_set_optimistic_power(self, power: bool) -> None:
+        """Show the new master power state before the next refresh confirms it."""
+        if self.data:
+            self.data.power = power
+            self.async_update_listeners()
+
+    @callback
+    def async_set_optimistic_source(self, output: int, source: int) -> None:
+        """Show the newly selected source of an output before the next refresh confirms it."""
+        outputs = self.outputs
+        if outputs and output <= len(outputs):
+            outputs[output - 1] = replace(outputs[output - 1], source=source)
+            self.async_update_listeners()
+
+    async def _async_send_command(self, command):
+        """Send a command to the matrix, then stop trusting the fetches started before it completed."""
+        self._bump_rate()
+        try:
+            return await command
+        finally:
+            self._command_generation += 1
 
     async def async_enable_output(self, output: int) -> bool:
         """Enable the output with the specified index."""
-        return await self._client.set_output_stream(output, True)
+        return await self._async_send_command(self._client.set_output_stream(output, True))
     
     async def async_enable_cat_output(self, output: int) -> bool:
         """Enable the cat output with the specified index."""
-        return await self._client.set_output_cat_stream(output, True)
+        return await self._async_send_command(self._client.set_output_cat_stream(output, True))
 
     async def async_disable_output(self, output: int) -> bool:
         """Disable the output with the specified index."""
-        return await self._client.set_output_stream(output, False)
+        return await self._async_send_command(self._client.set_output_stream(output, False))
     
     async def async_disable_cat_output(self, output: int) -> bool:
         """Disable the cat output with the specified index."""
-        return await self._client.set_output_cat_stream(output, False)
+        return await self._async_send_command(self._client.set_output_cat_stream(output, False))
 
     async def async_select_source(self, output: int, source: int) -> bool:
         """Select the input source for the specified output."""
-        return await self._client.set_video_source(output, source)
+        return await self._async_send_command(self._client.set_video_source(output, source))
 
     async def async_send_cec_output(self, output: int, command: int) -> bool:
         """Send a CEC command to the specified output."""
-        return await self._client.send_cec_output(output, command)
+        return await self._async_send_command(self._client.send_cec_output(output, command))
 
     async def async_send_cec_source(self, source: int, command: int) -> bool:
         """Send a CEC command to the specified source."""
-        return await self._client.send_cec_source(source, command)
+        return await self._async_send_command(self._client.send_cec_source(source, command))
     
     async def async_power_on(self) -> bool:
-        return await self._client.set_power(True)
+        return await self._async_send_command(self._client.set_power(True))
     
     async def async_power_off(self) -> bool:
-        return await self._client.set_power(False)
+        return await self._async_send_command(self._client.set_power(False))
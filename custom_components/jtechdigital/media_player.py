@@ -1,7 +1,11 @@
 """Media player support for J-Tech Digital HDMI Matrix integration."""
 from __future__ import annotations
 import asyncio
+from collections.abc import Mapping
+from enum import Enum
 import logging
+from types import MappingProxyType
+from typing import Final
 
 from homeassistant.components.media_player import (
     MediaPlayerDeviceClass,
@@ -19,27 +23,12 @@ from homeassistant.components.media_player import (
     SUPPORT_VOLUME_STEP,
     SUPPORT_VOLUME_MUTE,
 )
-from homeassistant.components.homekit.const import (
-    EVENT_HOMEKIT_TV_REMOTE_KEY_PRESSED,
-    KEY_ARROW_DOWN,
-    KEY_ARROW_LEFT,
-    KEY_ARROW_RIGHT,
-    KEY_ARROW_UP,
-    KEY_BACK,
-    KEY_EXIT,
-    KEY_FAST_FORWARD,
-    KEY_INFORMATION,
-    KEY_NEXT_TRACK,
-    KEY_PREVIOUS_TRACK,
-    KEY_REWIND,
-    KEY_SELECT,
-    KEY_PLAY_PAUSE,
-    ATTR_KEY_NAME,
-)
 from homeassistant.const import STATE_OFF, STATE_PLAYING, STATE_ON, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
 from .const import (
@@ -52,11 +41,46 @@ from .const import (
     CONF_CEC_OUTPUT_TOGGLE,
     CONF_CEC_DELAY_POWER, 
     CONF_CEC_DELAY_SOURCE,
+    EVENT_HOMEKIT_TV_REMOTE_KEY_PRESSED,
+    ATTR_KEY_NAME,
+    KEY_ARROW_DOWN,
+    KEY_ARROW_LEFT,
+    KEY_ARROW_RIGHT,
+    KEY_ARROW_UP,
+    KEY_BACK,
+    KEY_FAST_FORWARD,
+    KEY_INFORMATION,
+    KEY_REWIND,
+    KEY_SELECT,
+    SIGNAL_REMOTE_KEY_PRESSED,
 )
 from .coordinator import JtechCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+
+_KEY_NAME_MAPPING: Final[Mapping[str, int]] = MappingProxyType({
+    KEY_ARROW_UP: 3,
+    KEY_ARROW_LEFT: 4,
+    KEY_ARROW_RIGHT: 6,
+    KEY_ARROW_DOWN: 8,
+    KEY_SELECT: 5,
+    KEY_INFORMATION: 7,
+    KEY_BACK: 9,
+    KEY_REWIND: 13,
+    KEY_FAST_FORWARD: 15,
+})
+
+
+class _StateMode(Enum):
+    """Stream toggles that decide whether an output reads as on."""
+
+    HDMI_AND_CAT = "hdmi_and_cat"
+    CAT_ONLY = "cat_only"
+    HDMI_ONLY = "hdmi_only"
+    NONE = "none"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -69,97 +93,79 @@ async def async_setup_entry(
 
     assert config_entry.unique_id is not None
 
-    # Ensure we have the latest data from the coordinator
-    await coordinator.async_config_entry_first_refresh()
-
     # Create media player entities for each output in the HDMI matrix
     entities = [
-        JtechMediaPlayer(config_entry, coordinator, output_idx + 1) 
-            for output_idx, output_info in enumerate(coordinator.outputs)
+        JtechMediaPlayer(config_entry, coordinator, output_idx + 1)
+            for output_idx in range(len(coordinator.outputs or ()))
     ]
 
     entities.append(JtechMasterMediaPlayer(config_entry, coordinator))
 
     # Add the media player entities to Home Assistant
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
+    # every entry listens on the bus, only forward the key presses aimed at this entry's outputs
+    remote_ids = frozenset(entity.unique_id for entity in entities)
 
-class JtechMediaPlayer(MediaPlayerEntity):
+    @callback
+    def _async_remote_key_pressed(event):
+        """Route HomeKit TV remote key presses to the media player they target."""
+        remote_id = event.data.get("unique_id")
+        key_name = event.data.get(ATTR_KEY_NAME)
+
+        _LOGGER.debug("homekit_tv_remote_key_pressed %s: %s", remote_id, key_name)
+
+        if remote_id in remote_ids:
+            async_dispatcher_send(hass, f"{SIGNAL_REMOTE_KEY_PRESSED}_{remote_id}", key_name)
+
+    config_entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEKIT_TV_REMOTE_KEY_PRESSED, _async_remote_key_pressed))
+
+
+class JtechMediaPlayer(CoordinatorEntity[JtechCoordinator], MediaPlayerEntity):
     """Representation of a J-Tech Digital HDMI Matrix Output as a media player."""
 
     _attr_assumed_state = True
     _attr_has_entity_name = True
     _attr_name = None
     _attr_icon = "mdi:video-input-hdmi"
+    _attr_device_class = MediaPlayerDeviceClass.TV
 
     def _get_output_info(self):
         """Get the output information for the current output_index."""
-        return self._coordinator.outputs[self._output_index - 1]
+        outputs = self.coordinator.outputs
+        if outputs and self._output_index <= len(outputs):
+            return outputs[self._output_index - 1]
+        return None
 
-    def _get_source_info(self):
+    def _get_source_info(self, output_info):
         """Get the source information for the given output_info."""
-        output_info = self._get_output_info()
-        if output_info:
-            return self._coordinator.sources[output_info.source - 1]
+        sources = self.coordinator.sources
+        if output_info and sources and 0 < output_info.source <= len(sources):
+            return sources[output_info.source - 1]
         return None
 
-    def _get_hdmi_stream_toggle(self):
-        """Get the hdmi_stream_toggle option."""
-        return self._config_entry.options.get(CONF_HDMI_STREAM_TOGGLE, False)
-
-    def _get_cat_stream_toggle(self):
-        """Get the cat_stream_toggle option."""
-        return self._config_entry.options.get(CONF_CAT_STREAM_TOGGLE, False)
-
-    def _get_cec_delay_power(self):
-        """Get the cec_delay_power option."""
-        return self._config_entry.options.get(CONF_CEC_DELAY_POWER, 0)
-    
-    def _get_cec_delay_source(self):
-        """Get the cec_delay_source option."""
-        return self._config_entry.options.get(CONF_CEC_DELAY_SOURCE, 0)
-
-    def _get_cec_source_toggle(self):
-        """Get the cec_source_toggle option."""
-        return self._config_entry.options.get(CONF_CEC_SOURCE_TOGGLE, False)
-    
-    def _get_cec_output_toggle(self):
-        """Get the cec_output_toggle option."""
-        return self._config_entry.options.get(CONF_CEC_OUTPUT_TOGGLE, False)
-    
-    def _get_cec_volume_control(self):
-        """Get the volume_control option."""
-        return self._config_entry.options.get(CONF_CEC_VOLUME_CONTROL, "none")
-    
-    def _get_output_state(self, output_info):
-        hdmi_stream_toggle = self._get_hdmi_stream_toggle()
-        cat_stream_toggle = self._get_cat_stream_toggle()
-
-        if cat_stream_toggle and hdmi_stream_toggle:
-            if (output_info.cat_connected and output_info.cat_enabled and output_info.connected and output_info.enabled):
-                return True
-        else: 
-            if cat_stream_toggle:
-                if (output_info.cat_connected and output_info.cat_enabled):
-                    return True
-                    
-            if hdmi_stream_toggle:
-                if (output_info.connected and output_info.enabled):
-                    return True
-                
-            return True
-        return False
-
-    def __init__(self, config_entry: ConfigEntry, coordinator: JtechCoordinator, output_index: int):
-        """Initialize the media player."""
-        self._config_entry = config_entry
-        self._coordinator = coordinator
-        self._output_index = output_index
+    def _reload_options(self, options):
+        """Read the config entry options once instead of on every property access."""
+        self._options = options
+        self._hdmi_stream_toggle = options.get(CONF_HDMI_STREAM_TOGGLE, False)
+        self._cat_stream_toggle = options.get(CONF_CAT_STREAM_TOGGLE, False)
+        self._cec_delay_power = options.get(CONF_CEC_DELAY_POWER, 0)
+        self._cec_delay_source = options.get(CONF_CEC_DELAY_SOURCE, 0)
+        self._cec_source_toggle = options.get(CONF_CEC_SOURCE_TOGGLE, False)
+        self._cec_output_toggle = options.get(CONF_CEC_OUTPUT_TOGGLE, False)
+        self._cec_volume_control = options.get(CONF_CEC_VOLUME_CONTROL, "none")
+
+        # decide once per options change which connection flags the output state depends on
+        if self._hdmi_stream_toggle and self._cat_stream_toggle:
+            self._state_mode = _StateMode.HDMI_AND_CAT
+        elif self._cat_stream_toggle:
+            self._state_mode = _StateMode.CAT_ONLY
+        elif self._hdmi_stream_toggle:
+            self._state_mode = _StateMode.HDMI_ONLY
+        else:
+            self._state_mode = _StateMode.NONE
 
-    @property
-    def supported_features(self):
-        """Flag media player features that are supported."""
-        _supported_features = (
+        supported_features = (
             SUPPORT_SELECT_SOURCE
             | SUPPORT_PLAY_MEDIA
             | SUPPORT_PAUSE
@@ -170,135 +176,146 @@ class JtechMediaPlayer(MediaPlayerEntity):
         )
 
         # Add volume controls if available
-        cec_volume_control = self._get_cec_volume_control()
-        if cec_volume_control and cec_volume_control != "none":
-            _supported_features |= SUPPORT_VOLUME_STEP
-            _supported_features |= SUPPORT_VOLUME_MUTE
+        if self._cec_volume_control and self._cec_volume_control != "none":
+            supported_features |= SUPPORT_VOLUME_STEP
+            supported_features |= SUPPORT_VOLUME_MUTE
 
         # Add turn on/off controls if HDMI and CAT switches are not available
-        hdmi_stream_toggle = self._get_hdmi_stream_toggle()
-        cat_stream_toggle = self._get_cat_stream_toggle()
+        if self._hdmi_stream_toggle or self._cat_stream_toggle:
+            supported_features |= SUPPORT_TURN_ON
+            supported_features |= SUPPORT_TURN_OFF
 
-        if hdmi_stream_toggle or cat_stream_toggle:
-            _supported_features |= SUPPORT_TURN_ON
-            _supported_features |= SUPPORT_TURN_OFF
+        self._attr_supported_features = supported_features
 
-        return _supported_features
+    def _get_output_state(self, output_info):
+        state_mode = self._state_mode
+        if state_mode is _StateMode.HDMI_AND_CAT:
+            return bool(output_info.cat_connected and output_info.cat_enabled and output_info.connected and output_info.enabled)
+        if state_mode is _StateMode.CAT_ONLY:
+            return bool(output_info.cat_connected and output_info.cat_enabled)
+        if state_mode is _StateMode.HDMI_ONLY:
+            return bool(output_info.connected and output_info.enabled)
+        return True
+
+    def __init__(self, config_entry: ConfigEntry, coordinator: JtechCoordinator, output_index: int):
+        """Initialize the media player."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+        self._output_index = output_index
+        self._attr_unique_id = f"{config_entry.unique_id}_output_{output_index}"
+        self._last_signature = None
+        self._device_info_cache = None
+        self._device_info_key = None
+        self._reload_options(coordinator.options)
 
-    @property
-    def unique_id(self):
-        """Return a unique ID for the media player."""
-        return f"{self._config_entry.unique_id}_output_{self._output_index}"
-    
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
         output_info = self._get_output_info()
-
-        return DeviceInfo(
-            identifiers={ (DOMAIN, self.unique_id) },
-            name=output_info.name if output_info else f"Output {self._output_index}",
-            manufacturer=ATTR_MANUFACTURER,
-            model=self._coordinator.data["model"],
-            sw_version=self._coordinator.data["version"],
-            via_device=(DOMAIN, self._config_entry.unique_id),
-            configuration_url=f"http://{self._coordinator.data['hostname']}" if self._coordinator.data["hostname"] else None
-        )
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return MediaPlayerDeviceClass.TV
+        name = output_info.name if output_info else f"Output {self._output_index}"
+
+        key = (self.coordinator.device_info, name)
+        if key != self._device_info_key:
+            self._device_info_key = key
+            self._device_info_cache = DeviceInfo(
+                **self.coordinator.device_info,
+                identifiers={ (DOMAIN, self.unique_id) },
+                name=name,
+                via_device=(DOMAIN, self._config_entry.unique_id),
+            )
+        return self._device_info_cache
 
     # TODO: handle power of coordinator
 
-    @property
-    def state(self):
-        """Return the state of the media player."""
+    def _update_attrs(self):
+        """Compute the state, source and source list from the coordinator data."""
         output_info = self._get_output_info()
+        source_info = self._get_source_info(output_info)
+
         if output_info:
             if self._get_output_state(output_info):
-                source_info = self._get_source_info()
-                if source_info and source_info.active:
-                    return STATE_PLAYING
-                return STATE_ON
-
-            return STATE_OFF
-
-        # Output information not available, assume the state is unavailable
-        return STATE_UNAVAILABLE
+                self._attr_state = STATE_PLAYING if source_info and source_info.active else STATE_ON
+            else:
+                self._attr_state = STATE_OFF
+        else:
+            # Output information not available, assume the state is unavailable
+            self._attr_state = STATE_UNAVAILABLE
 
-    @property
-    def source_list(self):
-        """Return the list of available input sources."""
-        return [source.name for source in  self._coordinator.sources]
-
-    @property
-    def source(self):
-        """Return the current input source."""
-        output_info = self._get_output_info()
-        if output_info:
-            source_info = self._get_source_info()
-            if source_info:
-                return source_info.name
-        return None
+        self._attr_source = source_info.name if source_info else None
+        self._attr_source_list = self.coordinator.source_list
 
     async def async_select_source(self, source):
         """Select input source."""
-        for source_idx, source_info in enumerate(self._coordinator.sources):
-            if source_info.name == source:
-                await self._coordinator.async_select_source(self._output_index, source_idx + 1)
-                break
-        await self._coordinator.async_request_refresh()
+        source_idx = self.coordinator.source_indexes.get(source)
+        if source_idx is not None:
+            if await self.coordinator.async_select_source(self._output_index, source_idx + 1):
+                self.coordinator.async_set_optimistic_source(self._output_index, source_idx + 1)
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     async def async_turn_on(self):
         """Enable the output and send necessary CEC commands to turn on the connected devices."""
-        hdmi_stream_toggle = self._get_hdmi_stream_toggle()
-        cat_stream_toggle = self._get_cat_stream_toggle()
+        hdmi_stream_toggle = self._hdmi_stream_toggle
+        cat_stream_toggle = self._cat_stream_toggle
+        cec_source_toggle = self._cec_source_toggle
+        cec_output_toggle = self._cec_output_toggle
+        delay_power = self._cec_delay_power
+        delay_source = self._cec_delay_source
+
+        stream_tasks = []
         if hdmi_stream_toggle:
-            await self._coordinator.async_enable_output(self._output_index)
+            stream_tasks.append(self.coordinator.async_enable_output(self._output_index))
         if cat_stream_toggle:
-            await self._coordinator.async_enable_cat_output(self._output_index)
-
-        cec_source_toggle = self._get_cec_source_toggle()
-        cec_output_toggle = self._get_cec_output_toggle()
-        if (cec_source_toggle or cec_output_toggle) and (hdmi_stream_toggle or cat_stream_toggle):
-            delay_power = self._get_cec_delay_power()
-            if delay_power and delay_power > 0:
-                await asyncio.sleep(delay_power)
-        if cec_output_toggle:
-            await self._async_send_cec_source(1) # turn on selected source
+            stream_tasks.append(self.coordinator.async_enable_cat_output(self._output_index))
+        if stream_tasks:
+            await asyncio.gather(*stream_tasks)
+
+        if (cec_source_toggle or cec_output_toggle) and (hdmi_stream_toggle or cat_stream_toggle) and delay_power and delay_power > 0:
+            await asyncio.sleep(delay_power)
+
+        cec_tasks = []
+        if cec_source_toggle:
+            cec_tasks.append(self._async_send_cec_source(1)) # turn on selected source
         if cec_output_toggle:
-            await self._coordinator.async_send_cec_output(self._output_index, 0) # turn on hdmi monitor
-        
+            cec_tasks.append(self.coordinator.async_send_cec_output(self._output_index, 0)) # turn on hdmi monitor
+        if cec_tasks:
+            await asyncio.gather(*cec_tasks)
+
         if cec_output_toggle:
-            delay_source = self._get_cec_delay_source()
             if delay_source and delay_source > 0:
                 await asyncio.sleep(delay_source)
-            await self._coordinator.async_send_cec_output(self._output_index, 5)
-        await self._coordinator.async_request_refresh()
+            # nothing below depends on the final source command, let it finish in the background
+            self.hass.async_create_background_task(
+                self.coordinator.async_send_cec_output(self._output_index, 5),
+                name=f"{DOMAIN}_cec_output_{self._output_index}_source",
+            )
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     async def async_turn_off(self):
         """Disable the output."""
-        cec_source_toggle = self._get_cec_source_toggle()
-        cec_output_toggle = self._get_cec_output_toggle()
+        hdmi_stream_toggle = self._hdmi_stream_toggle
+        cat_stream_toggle = self._cat_stream_toggle
+        cec_source_toggle = self._cec_source_toggle
+        cec_output_toggle = self._cec_output_toggle
+        delay_power = self._cec_delay_power
+
+        cec_tasks = []
         if cec_output_toggle:
-            await self._coordinator.async_send_cec_output(self._output_index, 1)
+            cec_tasks.append(self.coordinator.async_send_cec_output(self._output_index, 1))
         if cec_source_toggle:
-            await self._async_send_cec_source(2) # turn off selected source
-        if cec_source_toggle or cec_output_toggle:
-            delay_power = self._get_cec_delay_power()
-            if delay_power and delay_power > 0:
-                await asyncio.sleep(self._get_cec_delay_power())
-
-        hdmi_stream_toggle = self._get_hdmi_stream_toggle()
-        cat_stream_toggle = self._get_cat_stream_toggle()
+            cec_tasks.append(self._async_send_cec_source(2)) # turn off selected source
+        if cec_tasks:
+            await asyncio.gather(*cec_tasks)
+        if (cec_source_toggle or cec_output_toggle) and delay_power and delay_power > 0:
+            await asyncio.sleep(delay_power)
+
+        stream_tasks = []
         if hdmi_stream_toggle:
-            await self._coordinator.async_disable_output(self._output_index)
+            stream_tasks.append(self.coordinator.async_disable_output(self._output_index))
         if cat_stream_toggle:
-            await self._coordinator.async_disable_cat_output(self._output_index)
-        await self._coordinator.async_request_refresh()
-        
+            stream_tasks.append(self.coordinator.async_disable_cat_output(self._output_index))
+        if stream_tasks:
+            await asyncio.gather(*stream_tasks)
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     async def async_volume_up(self):
         """Send CEC command to increase volume."""
@@ -313,17 +330,17 @@ class JtechMediaPlayer(MediaPlayerEntity):
         await self._async_volume_send_cec(2, 17)
 
     async def _async_volume_send_cec(self, output_command, source_command):
-        cec_volume_control = self._get_cec_volume_control()
+        cec_volume_control = self._cec_volume_control
 
         if cec_volume_control == "output":
-            await self._coordinator.async_send_cec_output(self._output_index, output_command)
+            await self.coordinator.async_send_cec_output(self._output_index, output_command)
         elif cec_volume_control == "source":
             await self._async_send_cec_source(source_command)
 
     async def _async_send_cec_source(self, source_command):
         output_info = self._get_output_info()
         if output_info:
-            await self._coordinator.async_send_cec_source(output_info.source, source_command)
+            await self.coordinator.async_send_cec_source(output_info.source, source_command)
 
     async def async_media_previous_track(self):
         """Send CEC command for previous track."""
@@ -345,53 +362,49 @@ class JtechMediaPlayer(MediaPlayerEntity):
         """Send CEC command to pause."""
         await self._async_send_cec_source(14)
 
-    async def _handle_tv_remote_key_press(self, event):
+    @callback
+    def _handle_tv_remote_key_press(self, key_name):
         """Handle HomeKit TV remote key presses."""
-        remote_id = event.data.get("unique_id")
-        key_name = event.data.get(ATTR_KEY_NAME)
-
-        _LOGGER.debug("homekit_tv_remote_key_pressed", event, event.data)
-
-        if remote_id == self.unique_id:
-            key_name_mapping = {
-                KEY_ARROW_UP: 3,
-                KEY_ARROW_LEFT: 4,
-                KEY_ARROW_RIGHT: 6,
-                KEY_ARROW_DOWN: 8,
-                KEY_SELECT: 5,
-                KEY_INFORMATION: 7,
-                KEY_BACK: 9,
-                KEY_REWIND: 13,
-                KEY_FAST_FORWARD: 15,
-            }
-            cec_command = key_name_mapping.get(key_name)
-            if cec_command:
-                # Send the CEC command
-                self._async_send_cec_source(cec_command)
+        cec_command = _KEY_NAME_MAPPING.get(key_name)
+        if cec_command:
+            # Send the CEC command
+            self.hass.async_create_task(self._async_send_cec_source(cec_command))
 
     async def async_added_to_hass(self):
         """Subscribe to updates and handle HomeKit TV remote key presses."""
-        self.hass.bus.async_listen(EVENT_HOMEKIT_TV_REMOTE_KEY_PRESSED, self._handle_tv_remote_key_press)
+        self._update_attrs()
+        await super().async_added_to_hass()
+        self.async_on_remove(async_dispatcher_connect(self.hass, f"{SIGNAL_REMOTE_KEY_PRESSED}_{self.unique_id}", self._handle_tv_remote_key_press))
 
     @callback
-    async def _handle_coordinator_update(self) -> None:
+    def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # the coordinator notifies its listeners when the options change, pick them up here
+        if self.coordinator.options is not self._options:
+            self._reload_options(self.coordinator.options)
+
         # Trigger an entity state update to reflect the latest data from the coordinator
-        _LOGGER.debug("handle_coordinator_update_data", self._coordinator.data)
+        self._update_attrs()
+
+        # skip the state machine write when nothing this entity shows has changed
+        signature = (self.available, self._attr_state, self._attr_source, self._attr_source_list, self._attr_supported_features)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
         self.async_write_ha_state()
 
 
-class JtechMasterMediaPlayer(MediaPlayerEntity):
+class JtechMasterMediaPlayer(CoordinatorEntity[JtechCoordinator], MediaPlayerEntity):
+
+    _attr_device_class = MediaPlayerDeviceClass.TV
 
     def __init__(self, config_entry: ConfigEntry, coordinator: JtechCoordinator):
         """Initialize the media player."""
+        super().__init__(coordinator)
         self._config_entry = config_entry
-        self._coordinator = coordinator
-
-    @property
-    def unique_id(self):
-        """Return a unique ID for the media player."""
-        return f"{self._config_entry.unique_id}_master"
+        self._attr_unique_id = f"{config_entry.unique_id}_master"
+        self._device_info_cache = None
+        self._device_info_key = None
 
     @property
     def supported_features(self):
@@ -405,45 +418,46 @@ class JtechMasterMediaPlayer(MediaPlayerEntity):
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
 
-        return DeviceInfo(
-            identifiers={ (DOMAIN, self.unique_id) },
-            name=f"{ATTR_MANUFACTURER} HDMI Matrix",
-            manufacturer=ATTR_MANUFACTURER,
-            model=self._coordinator.data["model"],
-            sw_version=self._coordinator.data["version"],
-            via_device=(DOMAIN, self._config_entry.unique_id),
-            configuration_url=f"http://{self._coordinator.data['hostname']}" if self._coordinator.data["hostname"] else None
-        )
+        if self.coordinator.device_info != self._device_info_key:
+            self._device_info_key = self.coordinator.device_info
+            self._device_info_cache = DeviceInfo(
+                **self.coordinator.device_info,
+                identifiers={ (DOMAIN, self.unique_id) },
+                name=f"{ATTR_MANUFACTURER} HDMI Matrix",
+                via_device=(DOMAIN, self._config_entry.unique_id),
+            )
+        return self._device_info_cache
     
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return MediaPlayerDeviceClass.TV
-
-    @property
-    def state(self):
-        """Return the state of the media player."""
-        power = self._coordinator.data.get("power", None)
+    def _update_attrs(self):
+        """Compute the state from the coordinator data."""
+        power = self.coordinator.data.power
         if power is None:
-            return STATE_UNAVAILABLE
-        if power:
-            return STATE_ON
+            self._attr_state = STATE_UNAVAILABLE
+        elif power:
+            self._attr_state = STATE_ON
         else:
-            return STATE_OFF
+            self._attr_state = STATE_OFF
 
     async def async_turn_on(self):
         """Turn on master power for the J-Tech Digital HDMI Matrix."""
-        await self._coordinator.async_power_on()
-        await self._coordinator.async_request_refresh()
+        if await self.coordinator.async_power_on():
+            self.coordinator.async_set_optimistic_power(True)
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     async def async_turn_off(self):
         """Turn off master power for the J-Tech Digital HDMI Matrix."""
-        await self._coordinator.async_power_off()
-        await self._coordinator.async_request_refresh()
+        if await self.coordinator.async_power_off():
+            self.coordinator.async_set_optimistic_power(False)
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+    async def async_added_to_hass(self):
+        """Subscribe to updates."""
+        self._update_attrs()
+        await super().async_added_to_hass()
 
     @callback
-    async def _handle_coordinator_update(self) -> None:
+    def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Trigger an entity state update to reflect the latest data from the coordinator
-        _LOGGER.debug("handle_coordinator_update_data", self._coordinator.data)
+        self._update_attrs()
         self.async_write_ha_state()
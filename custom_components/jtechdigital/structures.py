@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JtechOutputInfo:
     """Dataclass representing information about a J-Tech Digital HDMI Matrix output."""
     source: int
@@ -13,11 +13,31 @@ class JtechOutputInfo:
     scaler: int
     cec_selected: bool
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JtechSourceInfo:
     """Dataclass representing information about a J-Tech Digital HDMI Matrix input source."""
-    outputs: list[int]
+    outputs: tuple[int, ...]
     name: str
     active: bool
     edid_index: int
-    cec_selected: bool
\ No newline at end of file
+    cec_selected: bool
+
+@dataclass(slots=True)
+class JtechCoordinatorSnapshot:
+    """Dataclass representing the J-Tech Digital HDMI Matrix details fetched by the coordinator."""
+    power: bool | None = None
+    model: str | None = None
+    version: str | None = None
+    hostname: str | None = None
+    ipaddress: str | None = None
+    subnet: str | None = None
+    gateway: str | None = None
+    macaddress: str | None = None
+    dhcp: bool | None = None
+    telnetport: int | None = None
+    tcpport: int | None = None
+    baudrate_index: int | None = None
+    beep: bool | None = None
+    lock: bool | None = None
+    mode: int | None = None
+    title: str | None = None
\ No newline at end of file